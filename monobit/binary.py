@@ -17,10 +17,26 @@ def align(num, exp):
 
 def bytes_to_bits(inbytes, width=None):
     """Convert bytes/bytearray/sequence of int to tuple of bits."""
-    bitstr = ''.join('{:08b}'.format(_b) for _b in inbytes)
-    bits = tuple(_c == '1' for _c in bitstr)
+    inbytes = bytes(inbytes)
+    if not inbytes:
+        return ()
+    # unpack the whole sequence as one integer rather than byte by byte
+    bitstr = '{:0{}b}'.format(int.from_bytes(inbytes, 'big'), 8*len(inbytes))
+    bits = tuple(map('1'.__eq__, bitstr))
     return bits[:width]
 
+# map 0/1 bytes to '0'/'1' digits
+_BIT_DIGITS = bytes.maketrans(b'\0\1', b'01')
+
+def bits_to_bytes(bits):
+    """Convert sequence of bits to bytes, padding the last byte with zeros."""
+    if not bits:
+        return b''
+    bytewidth = ceildiv(len(bits), 8)
+    # pack the whole sequence into one integer rather than byte by byte
+    value = int(bytes(bits).translate(_BIT_DIGITS), 2)
+    return (value << (8*bytewidth - len(bits))).to_bytes(bytewidth, 'big')
+
 def int_to_bytes(in_int, byteorder='big'):
     """Convert integer to bytes."""
     return in_int.to_bytes(max(1, ceildiv(in_int.bit_length(), 8)), byteorder)
@@ -22,7 +22,7 @@ from pathlib import Path, PurePath, PurePosixPath
 from .streams import (
     MagicRegistry, FileFormatError,
     StreamBase, StreamWrapper, Stream, KeepOpen,
-    get_suffix, open_stream, get_name
+    get_suffix, open_stream, get_name, BUFFER_SIZE
 )
 
 
@@ -35,14 +35,15 @@ class ContainerFormatError(FileFormatError):
 
 containers = MagicRegistry()
 
-def open_container(file, mode, overwrite=False):
-    """Open container of the appropriate type."""
+def open_container(file, mode, overwrite=False, container_type=None):
+    """Open container of the appropriate type, unless the type is given."""
     if isinstance(file, Container):
         return file
     if not file:
         # no-container, will throw errors when used
         return Container(None)
-    container_type = _identify_container(file, mode, overwrite)
+    if not container_type:
+        container_type = _identify_container(file, mode, overwrite)
     container = container_type(file, mode, overwrite=overwrite)
     logging.debug("Opening %s container `%s` for '%s'.", container_type.__name__, container.name, mode)
     return container
@@ -69,6 +70,12 @@ def _identify_container(file, mode, overwrite):
 class Container(StreamBase):
     """Base class for container types."""
 
+    def __init__(self, stream, mode='', name=''):
+        """Create container."""
+        super().__init__(stream, mode, name)
+        # next index to try for unused names, by stem and suffix
+        self._name_index = {}
+
     def __iter__(self):
         """List contents."""
         raise NotImplementedError
@@ -79,9 +86,13 @@ class Container(StreamBase):
 
     def unused_name(self, stem, suffix):
         """Generate unique name for container file."""
-        for i in itertools.count():
+        # names generated earlier may not show up in an archive until it is written
+        # so continue from the last index we handed out
+        start = self._name_index.get((stem, suffix), 0)
+        for i in itertools.count(start):
             filename = '{}.{}.{}'.format(stem, i, suffix)
             if filename not in self:
+                self._name_index[stem, suffix] = i + 1
                 return filename
 
 ###################################################################################################
@@ -122,17 +133,34 @@ class DirContainer(Container):
         # don't walk the whole filesystem - no path is no contents
         if not self._path:
             return ()
-        return (
-            str((Path(_r) / _f).relative_to(self._path))
-            for _r, _, _files in os.walk(self._path)
-            for _f in _files
-        )
+        return _scan_dir(self._path)
 
     def __contains__(self, name):
         """File exists in container."""
         return (self._path / name).exists()
 
 
+def _scan_dir(path, prefix=''):
+    """List files in directory tree, relative to it, in the same order as os.walk."""
+    # scandir entries tell us if they're directories without another stat call
+    try:
+        with os.scandir(path) as entries:
+            entries = list(entries)
+    except OSError:
+        # e.g. unreadable directory, skipped like os.walk does
+        return
+    subdirs = []
+    for entry in entries:
+        if entry.is_dir():
+            # don't follow symlinks to directories
+            if not entry.is_symlink():
+                subdirs.append(entry)
+        else:
+            yield os.path.join(prefix, entry.name)
+    for entry in subdirs:
+        yield from _scan_dir(entry.path, os.path.join(prefix, entry.name))
+
+
 ###################################################################################################
 # zip archive
 
@@ -251,7 +279,8 @@ class TarContainer(Container):
                 logging.debug('Writing out `%s` to tar container `%s`.', name, self.name)
                 tinfo = tarfile.TarInfo(name)
                 tinfo.mtime = time.time()
-                tinfo.size = len(file.getvalue())
+                # the end position is the size, no need to copy out the buffer
+                tinfo.size = file.seek(0, io.SEEK_END)
                 file.seek(0)
                 self._tarfile.addfile(tinfo, file)
                 file.close()
@@ -313,6 +342,12 @@ class Compressor(Container):
         """Open a stream in the container."""
         mode = mode[:1] or self.mode
         wrapped = self.compressor.open(self._stream, mode + 'b')
+        if mode == 'r':
+            # decompress in large chunks
+            wrapped = io.BufferedReader(wrapped, buffer_size=BUFFER_SIZE)
+        else:
+            # coalesce small writes before compressing
+            wrapped = io.BufferedWriter(wrapped, buffer_size=BUFFER_SIZE)
         wrapped = Stream(wrapped, mode, name=self._content_name)
         logging.debug(
             "Opening %s-compressed stream `%s` on `%s` for mode '%s'",
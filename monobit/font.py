@@ -423,9 +423,14 @@ class Font:
 
     def add_history(self, history):
         """Return a copy with a line added to history."""
-        return self.set_properties(history='\n'.join(
+        history = '\n'.join(
             _line for _line in self.history.split('\n') + [history] if _line
-        ))
+        )
+        # this is applied after every font operation
+        # history does not affect the glyphs, so don't rebuild the font through set_properties
+        font = self._replace_glyphs(self._glyphs)
+        font._properties = {**self._properties, 'history': history}
+        return font
 
     def set_properties(self, **kwargs):
         """Return a copy with amended properties."""
@@ -768,6 +773,19 @@ class Font:
         return Font(glyphs, self._comments, self._properties)
 
 
+    def _replace_glyphs(self, glyphs):
+        """
+        Return a font with glyphs replaced, keeping labels and lookup tables.
+        Glyphs must have the same labels as the current glyphs, and be in the same order.
+        """
+        # glyph operations only change pixels and comments
+        # so there is no need to relabel the glyphs and rebuild the lookup tables
+        font = object.__new__(type(self))
+        vars(font).update(vars(self))
+        font._glyphs = tuple(glyphs)
+        return font
+
+
     ##########################################################################
     # inject Glyph operations into Font
 
@@ -781,7 +799,7 @@ class Font:
                 operation(_glyph, *args, **kwargs)
                 for _glyph in self._glyphs
             )
-            return Font(glyphs, self._comments, self._properties)
+            return self._replace_glyphs(glyphs)
 
         locals()[_name] = _modify
 
@@ -13,7 +13,7 @@ from ..storage import loaders, savers
 from ..streams import FileFormatError
 from ..font import Font, Coord
 from ..glyph import Glyph
-from ..struct import Props, flag, bitfield, big_endian as be
+from ..struct import Props, flag, bitfield, log_props, big_endian as be
 from .. import struct
 
 
@@ -210,13 +210,9 @@ def _load_amiga(f, where):
     # read & ignore header
     _read_header(f)
     amiga_props, glyphs = _read_font_hunk(f)
-    logging.info('Amiga properties:')
-    for name, value in vars(amiga_props).items():
-        logging.info('    %s: %s', name, value)
+    log_props('Amiga', vars(amiga_props))
     props, glyphs = _convert_amiga_font(amiga_props, glyphs)
-    logging.info('yaff properties:')
-    for line in str(props).splitlines():
-        logging.info('    ' + line)
+    log_props('yaff', props)
     return Font(glyphs, properties=vars(props))
 
 
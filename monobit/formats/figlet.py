@@ -5,15 +5,14 @@ monobit.figlet - FIGlet .flf format
 licence: https://opensource.org/licenses/MIT
 """
 
-import logging
+from itertools import islice
 from typing import NamedTuple
 
-from ..matrix import to_text
 from ..storage import loaders, savers
 from ..streams import FileFormatError
 from ..font import Font
-from ..glyph import Glyph
-from ..struct import Props, reverse_dict
+from ..glyph import Glyph, Bounds
+from ..struct import Props, reverse_dict, log_props
 from ..taggers import extend_string, tagmaps
 from ..label import Codepoint
 
@@ -31,13 +30,9 @@ from ..label import Codepoint
 def load_flf(instream, where=None, *, ink:str=''):
     """Load font from a FIGlet .flf file."""
     flf_glyphs, flf_props, comments = _read_flf(instream.text, ink=ink)
-    logging.info('figlet properties:')
-    for line in str(flf_props).splitlines():
-        logging.info('    ' + line)
+    log_props('figlet', flf_props)
     glyphs, props = _convert_from_flf(flf_glyphs, flf_props)
-    logging.info('yaff properties:')
-    for line in str(props).splitlines():
-        logging.info('    ' + line)
+    log_props('yaff', props)
     return Font(glyphs, properties=vars(props), comments=comments)
 
 @savers.register(linked=load_flf)
@@ -47,9 +42,7 @@ def save_flf(fonts, outstream, where=None):
         raise FileFormatError('Can only save one font to .flf file.')
     font, = fonts
     flf_glyphs, flf_props, comments = _convert_to_flf(font)
-    logging.info('figlet properties:')
-    for line in str(flf_props).splitlines():
-        logging.info('    ' + line)
+    log_props('figlet', flf_props)
     _write_flf(outstream.text, flf_glyphs, flf_props, comments)
 
 
@@ -63,6 +56,7 @@ _DIRECTIONS = {
     '0': 'left-to-right',
     '1': 'right-to-left'
 }
+_DIRECTIONS_REVERSE = reverse_dict(_DIRECTIONS)
 
 _SIGNATURE = 'flf2a'
 
@@ -88,6 +82,8 @@ class _FLF_HEADER(NamedTuple):
     full_layout: int = 0
     codetag_count: int = 0
 
+# format string for the header line
+_HEADER_FMT = ' '.join(('{}',) * len(_FLF_HEADER._fields)) + '\n'
 
 
 ##############################################################################
@@ -95,14 +91,20 @@ class _FLF_HEADER(NamedTuple):
 
 def _read_flf(instream, ink=None):
     """Read font from a FIGlet .flf file."""
-    props = _read_props(instream)
-    comments = _read_comments(instream, props)
-    glyphs = _read_glyphs(instream, props, ink=ink)
+    # read the whole file in one go and parse from the list of lines
+    # split on newlines only, like iterating over the stream would
+    lines = instream.read().split('\n')
+    if not lines[-1]:
+        lines.pop()
+    lines = iter(lines)
+    props = _read_props(lines)
+    comments = _read_comments(lines, props)
+    glyphs = _read_glyphs(lines, props, ink=ink)
     return glyphs, props, comments
 
-def _read_props(instream):
+def _read_props(lines):
     """Read .flf property header."""
-    header = _FLF_HEADER(*instream.readline().strip().split())
+    header = _FLF_HEADER(*next(lines, '').strip().split())
     if not header.signature_hardblank.startswith(_SIGNATURE):
         raise FileFormatError('Not a FIGlet .flf file: does not start with `flf2a` signature.')
     return Props(
@@ -110,37 +112,43 @@ def _read_props(instream):
         **header._asdict()
     )
 
-def _read_comments(instream, props):
+def _read_comments(lines, props):
     """Parse comments at start."""
     return '\n'.join(
         line.rstrip()
-        for _, line in zip(range(int(props.comment_lines)), instream)
+        for line in islice(lines, int(props.comment_lines))
     )
 
-def _read_glyphs(instream, props, ink=''):
+def _read_glyphs(lines, props, ink=''):
     """Parse glyphs."""
+    # paper characters are the same for all glyphs
+    paper = frozenset((' ', props.hardblank))
     # glyphs in default repertoire
-    glyphs = [_read_glyph(instream, props, codepoint=_i) for _i in _CODEPOINTS]
+    glyphs = [_read_glyph(lines, props, paper, codepoint=_i) for _i in _CODEPOINTS]
     # code-tagged glyphs
-    for line in instream:
+    for line in lines:
         line = line.rstrip()
         # codepoint, unicode name label
         codepoint, _, tag = line.partition(' ')
-        glyphs.append(_read_glyph(instream, props, codepoint=int(codepoint, 0), tag=tag, ink=ink))
+        glyphs.append(_read_glyph(
+            lines, props, paper, codepoint=int(codepoint, 0), tag=tag, ink=ink
+        ))
     return glyphs
 
-def _read_glyph(instream, props, codepoint, tag='', ink=''):
-    glyph_lines = [_line.rstrip() for _, _line, in zip(range(int(props.height)), instream)]
+def _read_glyph(lines, props, paper, codepoint, tag='', ink=''):
     # > In most FIGfonts, the endmark character is either "@" or "#".  The FIGdriver
     # > will eliminate the last block of consecutive equal characters from each line
     # > of sub-characters when the font is read in.  By convention, the last line of
     # > a FIGcharacter has two endmarks, while all the rest have one. This makes it
     # > easy to see where FIGcharacters begin and end.  No line should have more
     # > than two endmarks.
-    glyph_lines = [_line.rstrip(_line[-1]) for _line in glyph_lines]
+    # strip trailing whitespace and then the endmarks, in one pass over the lines
+    glyph_lines = [
+        _line.rstrip(_line[-1])
+        for _line in (_l.rstrip() for _l in islice(lines, int(props.height)))
+    ]
     # check number of characters excluding spaces
-    paper = [' ', props.hardblank]
-    charset = set(''.join(glyph_lines)) - set(paper)
+    charset = set(''.join(glyph_lines)) - paper
     # if multiple characters per glyph found, ink characters must be specified explicitly
     if len(charset) > 1:
         if not ink:
@@ -149,7 +157,7 @@ def _read_glyph(instream, props, codepoint, tag='', ink=''):
                 f'encountered {list(charset)}.'
             )
         else:
-            paper += list(charset - set(ink))
+            paper = paper | (charset - set(ink))
     return Glyph.from_matrix(glyph_lines, paper=paper).modify(
         codepoint=codepoint, tags=[tag]
     )
@@ -178,8 +186,9 @@ def _convert_from_flf(glyphs, props):
 
 def _convert_to_flf(font, hardblank='$'):
     """Convert monobit glyphs and properties to figlet."""
-    # convert to unicode
-    font = font.set_properties(encoding=_ENCODING)
+    # convert to unicode, unless it already is
+    if font.encoding != _ENCODING:
+        font = font.set_properties(encoding=_ENCODING)
     # count glyphs outside the default set
     # we can only encode glyphs that have chars
     # latin-1 codepoints, so we can just use chr()
@@ -202,7 +211,7 @@ def _convert_to_flf(font, hardblank='$'):
         # > The Print_Direction parameter tells which direction the font is to be
         # > printed by default.  A value of 0 means left-to-right, and 1 means
         # > right-to-left.  If this parameter is absent, 0 (left-to-right) is assumed.
-        print_direction=reverse_dict(_DIRECTIONS)[font.direction],
+        print_direction=_DIRECTIONS_REVERSE[font.direction],
         # layout parameters - keep to default, there is not much we can sensibly do
         full_layout=0,
         codetag_count = len(coded_chars)
@@ -233,41 +242,50 @@ def _convert_to_flf(font, hardblank='$'):
     # > in the current FIGfont, it will print FIGcharacter 0.  If there
     # > is no FIGcharacter 0, nothing will be printed.
     glyphs.append(font.get_default_glyph().modify(codepoint=0))
-    # expand glyphs by bearings
+    # pair glyphs with padding by bearings, to be added on output
     glyphs = [
-        _g.expand(
+        (_g, Bounds(
             left=max(0, font.offset.x + _g.offset.x),
             bottom=max(0, font.offset.y + _g.offset.y),
             right=max(0, font.tracking + _g.tracking),
             # include leading; ensure glyphs are equal height
             top=max(0, font.line_height - _g.height - max(0, font.offset.y + _g.offset.y)),
-        )
+        ))
         for _g in glyphs
     ]
     return glyphs, props, comments
 
 def _write_flf(outstream, flf_glyphs, flf_props, comments, ink='#', paper=' ', hardblank='$'):
     """Write out a figlet font file."""
+    # collect the output and write it out in one go
+    output = []
     # header
     header = _FLF_HEADER(**vars(flf_props))
-    outstream.write(' '.join(str(_elem) for _elem in header) + '\n')
+    output.append(_HEADER_FMT.format(*header))
     # global comment
-    outstream.write(comments + '\n')
+    output.append(comments + '\n')
     # use hardblank for space char (first char)
-    outstream.write(_format_glyph(flf_glyphs[0], ink=ink, paper=hardblank))
-    for glyph in flf_glyphs[1:len(_CODEPOINTS)]:
-        outstream.write(_format_glyph(glyph, ink=ink, paper=paper))
-    for glyph in flf_glyphs[len(_CODEPOINTS):]:
+    output.append(_format_glyph(*flf_glyphs[0], ink=ink, paper=hardblank))
+    for glyph, padding in flf_glyphs[1:len(_CODEPOINTS)]:
+        output.append(_format_glyph(glyph, padding, ink=ink, paper=paper))
+    for glyph, padding in flf_glyphs[len(_CODEPOINTS):]:
         tag = glyph.tags[0] if glyph.tags else tagmaps['unicode'].get_tag(glyph)
-        outstream.write('{} {}\n'.format(Codepoint(glyph.codepoint), tag))
-        outstream.write(_format_glyph(glyph, ink=ink, paper=paper))
-
-
-def _format_glyph(glyph, ink='#', paper=' ', end='@'):
-    lines = [
-        f'{_line}{end}'
-        for _line in to_text(glyph.as_matrix(), ink=ink, paper=paper).splitlines()
-    ]
+        output.append('{} {}\n'.format(Codepoint(glyph.codepoint), tag))
+        output.append(_format_glyph(glyph, padding, ink=ink, paper=paper))
+    outstream.write(''.join(output))
+
+
+def _format_glyph(glyph, padding, ink='#', paper=' ', end='@'):
+    """Format glyph as FIGcharacter, adding blank padding while writing out the lines."""
+    left, bottom, right, top = padding
+    blank = paper * (left + glyph.width + right)
+    rows = glyph.as_text(ink=ink, paper=paper).split('\n') if glyph.height else []
+    lines = (
+        [blank] * top
+        + [f'{paper * left}{_row}{paper * right}' for _row in rows]
+        + [blank] * bottom
+    )
+    lines = [f'{_line}{end}' for _line in lines]
     if lines:
         lines[-1] += end + '\n'
     return '\n'.join(lines)
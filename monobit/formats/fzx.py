@@ -9,7 +9,7 @@ import logging
 from itertools import accumulate
 
 from ..binary import ceildiv
-from ..struct import Props, bitfield, little_endian as le
+from ..struct import Props, bitfield, log_props, little_endian as le
 from ..storage import loaders, savers
 from ..font import Font
 from ..glyph import Glyph
@@ -26,13 +26,9 @@ _FZX_RANGE = range(32, 256)
 def load_fzx(instream, where=None):
     """Load font from ZX Spectrum .FZX file."""
     fzx_props, fzx_glyphs = _read_fzx(instream)
-    logging.info('FZX properties:')
-    for line in str(fzx_props).splitlines():
-        logging.info('    ' + line)
+    log_props('FZX', fzx_props)
     props, glyphs = _convert_from_fzx(fzx_props, fzx_glyphs)
-    logging.info('yaff properties:')
-    for line in str(props).splitlines():
-        logging.info('    ' + line)
+    log_props('yaff', props)
     return Font(glyphs, properties=vars(props))
 
 
@@ -43,9 +39,7 @@ def save_fzx(fonts, outstream, where=None):
         raise FileFormatError('Can only save one font to PSF file.')
     font, = fonts
     fzx_props, fzx_glyphs = _convert_to_fzx(font)
-    logging.info('FZX properties:')
-    for line in str(fzx_props).splitlines():
-        logging.info('    ' + line)
+    log_props('FZX', fzx_props)
     _write_fzx(outstream, fzx_props, fzx_glyphs)
 
 
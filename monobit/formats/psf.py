@@ -158,11 +158,12 @@ def save_psf(fonts, outstream, where=None):
         length=len(glyphs),
         headersize=_PSF2_HEADER.size + len(_PSF2_MAGIC)
     )
-    outstream.write(_PSF2_MAGIC)
-    outstream.write(bytes(_PSF2_HEADER(**psf_props)))
-    # save_aligned
-    for glyph in glyphs:
-        outstream.write(glyph.as_bytes())
+    # write header and aligned glyphs in one go
+    outstream.write(b''.join((
+        _PSF2_MAGIC,
+        bytes(_PSF2_HEADER(**psf_props)),
+        *(_glyph.as_bytes() for _glyph in glyphs)
+    )))
     unicode_seq = [_glyph.char for _glyph in glyphs]
     _write_unicode_table(outstream, unicode_seq, _PSF2_SEPARATOR, _PSF2_STARTSEQ, 'utf-8')
     return font
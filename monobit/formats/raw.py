@@ -57,8 +57,7 @@ def save_aligned(outstream, font, encoding=None):
         raise FileFormatError(
             'This format only supports character-cell fonts.'
         )
-    for glyph in font.glyphs:
-        outstream.write(glyph.as_bytes())
+    outstream.write(b''.join(_glyph.as_bytes() for _glyph in font.glyphs))
 
 
 def load_strike(instream, width, height, numchars):
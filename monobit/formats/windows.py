@@ -32,7 +32,7 @@ import logging
 import itertools
 
 from ..binary import bytes_to_bits, ceildiv, align
-from ..struct import reverse_dict, little_endian as le
+from ..struct import reverse_dict, log_props, little_endian as le
 from .. import struct
 from ..storage import loaders, savers
 from ..streams import FileFormatError
@@ -698,9 +698,7 @@ def _parse_win_props(fnt, win_props):
     version = win_props.dfVersion
     if win_props.dfType & 1:
         raise ValueError('Not a bitmap font')
-    logging.info('Windows FNT properties:')
-    for key, value in win_props.__dict__.items():
-        logging.info('    {}: {}'.format(key, value))
+    log_props('Windows FNT', win_props.__dict__)
     properties = {
         'source-format': 'Windows FNT v{}.{}'.format(*divmod(version, 256)),
         'family': bytes_to_str(fnt[win_props.dfFace:]),
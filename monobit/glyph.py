@@ -8,17 +8,19 @@ licence: https://opensource.org/licenses/MIT
 import binascii
 import logging
 from typing import NamedTuple
+from itertools import chain
+from operator import not_
 import numbers
 
+from functools import lru_cache
 try:
     # python 3.9
     from functools import cache
 except ImportError:
-    from functools import lru_cache
     cache = lru_cache()
 
 from .scripting import scriptable
-from .binary import ceildiv, bytes_to_bits
+from .binary import ceildiv, bytes_to_bits, bits_to_bytes
 from .matrix import to_text
 from .encoding import is_graphical
 from .label import Char, Codepoint, Tag, label
@@ -27,6 +29,25 @@ from .label import Char, Codepoint, Tag, label
 NOT_SET = object()
 
 
+# glyphs in a font tend to share many of their rows (blank rows, stems, bars)
+# keep one copy of each row and memoise the row transformations
+
+@lru_cache(maxsize=4096)
+def _intern_row(row):
+    """Return the stored copy of a row equal to the one given."""
+    return row
+
+@lru_cache(maxsize=4096)
+def _invert_row(row):
+    """Reverse video on a row of pixels."""
+    return _intern_row(tuple(map(not_, row)))
+
+@lru_cache(maxsize=4096)
+def _stretch_row(row, factor):
+    """Repeat each pixel in a row."""
+    return _intern_row(tuple(chain.from_iterable(zip(*(row,)*factor))))
+
+
 def number(value=0):
     """Convert to int or float."""
     if isinstance(value, str):
@@ -142,8 +163,6 @@ class Glyph:
             **kwargs
         ):
         """Create glyph from tuple of tuples."""
-        # glyph data
-        self._rows = tuple(tuple(bool(_bit) for _bit in _row) for _row in pixels)
         # labels
         self._codepoint = Codepoint(codepoint).value
         self._char = Char(char).value
@@ -156,6 +175,12 @@ class Glyph:
         self._kern_to = KernTable(kern_to)
         # custom properties - not used but kept
         self._props = {_k.replace('_', '-'): _v for _k, _v in kwargs.items() if _v is not None}
+        # glyph data
+        self._set_pixels(pixels)
+
+    def _set_pixels(self, pixels):
+        """Set the glyph data from tuple of tuples."""
+        self._rows = tuple(_intern_row(tuple(map(bool, _row))) for _row in pixels)
         if len(set(len(_r) for _r in self._rows)) > 1:
             raise ValueError(
                 f'All rows in a glyph must be of the same width: {repr(self)}'
@@ -278,6 +303,16 @@ class Glyph:
             **kwargs
         ):
         """Return a copy of the glyph with changes."""
+        if pixels is not NOT_SET and not kwargs and all(
+                _arg is NOT_SET
+                for _arg in (tags, char, codepoint, comments, offset, tracking, kern_to)
+            ):
+            # only the pixels change, as in all glyph operations
+            # labels and properties are already validated, so don't convert them again
+            glyph = object.__new__(type(self))
+            vars(glyph).update(vars(self))
+            glyph._set_pixels(pixels)
+            return glyph
         if pixels is NOT_SET:
             pixels = self._rows
         if tags is NOT_SET:
@@ -326,6 +361,15 @@ class Glyph:
             for _row in self._rows
         )
 
+    def as_text(self, ink='@', paper='.', line_break='\n'):
+        """Return text representation with user-specified foreground and background characters."""
+        # convert rows to strings of \0 and \1 and translate these in one call per row
+        table = {0: paper, 1: ink}
+        return line_break.join(
+            bytes(_row).decode('latin-1').translate(table)
+            for _row in self._rows
+        )
+
     def as_tuple(self, ink=1, paper=0):
         """Return flat tuple of user-specified foreground and background objects."""
         return tuple(
@@ -349,27 +393,8 @@ class Glyph:
 
     def as_bytes(self):
         """Convert glyph to flat bytes."""
-        if not self._rows:
-            return b''
-        width = len(self._rows[0])
-        bytewidth = ceildiv(width, 8)
-        # byte-align rows
-        rows = [
-            _row + (False,) * (bytewidth*8 - width)
-            for _row in self._rows
-        ]
-        # chunk by byte and flatten
-        glyph_bytes = [
-            _row[_offs:_offs+8]
-            for _row in rows
-            for _offs in range(0, len(_row), 8)
-        ]
-        # convert to binary strings
-        glyph_bytes = [
-            ''.join(str(int(_bit)) for _bit in _byte)
-            for _byte in glyph_bytes
-        ]
-        return bytes(int(_bitstr, 2) for _bitstr in glyph_bytes)
+        # rows are byte-aligned
+        return b''.join(bits_to_bytes(_row) for _row in self._rows)
 
     @classmethod
     def from_hex(cls, hexstr, width, height):
@@ -491,17 +516,20 @@ class Glyph:
         rows: number of rows to roll (down if positive)
         columns: number of columns to roll (to right if positive)
         """
-        rolled = self
+        # roll rows and columns on the pixels, then create a single glyph
+        pixels = self._rows
         if self.height > 1 and rows:
-            rolled = rolled.modify(rolled._rows[-rows:] + rolled._rows[:-rows])
+            pixels = pixels[-rows:] + pixels[:-rows]
         if self.width > 1 and columns:
-            rolled = rolled.modify(tuple(_row[-columns:] + _row[:-columns] for _row in rolled._rows))
-        return rolled
+            pixels = tuple(_row[-columns:] + _row[:-columns] for _row in pixels)
+        if pixels is self._rows:
+            return self
+        return self.modify(pixels)
 
     @scriptable
     def transpose(self):
         """Transpose glyph."""
-        return self.modify(tuple(tuple(_x) for _x in zip(*self._rows)))
+        return self.modify(tuple(zip(*self._rows)))
 
     @scriptable
     def rotate(self, turns:int=1):
@@ -511,18 +539,24 @@ class Glyph:
         turns: number of turns to rotate (clockwise if positive)
         """
         turns %= 4
+        # compose the transformations on the pixels, without intermediate glyphs
         if turns == 3:
-            return self.transpose().flip()
+            # transpose, flip
+            pixels = tuple(zip(*self._rows))[::-1]
         elif turns == 2:
-            return self.mirror().flip()
+            # mirror, flip
+            pixels = tuple(_row[::-1] for _row in self._rows[::-1])
         elif turns == 1:
-            return self.transpose().mirror()
-        return self
+            # transpose, mirror - equivalent to transposing the flipped rows
+            pixels = tuple(zip(*self._rows[::-1]))
+        else:
+            return self
+        return self.modify(pixels)
 
     @scriptable
     def invert(self):
         """Reverse video."""
-        return self.modify(tuple(tuple((not _col) for _col in _row) for _row in self._rows))
+        return self.modify(tuple(_invert_row(_row) for _row in self._rows))
 
     @scriptable
     def crop(self, left:int=0, bottom:int=0, right:int=0, top:int=0):
@@ -570,13 +604,10 @@ class Glyph:
         factor_x: number of times to repeat horizontally
         factor_y: number of times to repeat vertically
         """
-        # vertical stretch
-        glyph = tuple(_row for _row in self._rows for _ in range(factor_y))
         # horizontal stretch
-        glyph = tuple(
-            tuple(_col for _col in _row for _ in range(factor_x))
-            for _row in glyph
-        )
+        glyph = tuple(_stretch_row(_row, factor_x) for _row in self._rows)
+        # vertical stretch - repeat the (already stretched) row objects
+        glyph = tuple(_row for _row in glyph for _ in range(factor_y))
         return self.modify(glyph)
 
     @scriptable
@@ -596,6 +627,6 @@ class Glyph:
                 alt = self._rows[offs::factor_y]
                 if shrunk_glyph != alt:
                     raise ValueError("can't shrink glyph without loss")
-        # horizontal stretch
-        glyph = tuple(_row[::factor_x] for _row in self._rows)
+        # horizontal shrink
+        glyph = tuple(_row[::factor_x] for _row in shrunk_glyph)
         return self.modify(glyph)
@@ -33,7 +33,10 @@ class Pack:
         return self._fonts[index]
 
     def __add__(self, other):
-        return Pack(self._fonts + Pack(other)._fonts)
+        # no need to copy into a new pack if we already have one
+        if not isinstance(other, Pack):
+            other = Pack(other)
+        return Pack(self._fonts + other._fonts)
 
     def select(self, **properties):
         """Get a subset from the pack by property. E.g. select(name='Times')."""
@@ -5,12 +5,14 @@ monobit.storage - load and save fonts
 licence: https://opensource.org/licenses/MIT
 """
 
+import sys
 import logging
 from pathlib import Path
-from contextlib import contextmanager
+from functools import partial
+from contextlib import contextmanager, nullcontext
 
 from .constants import VERSION, DEFAULT_FORMAT, CONVERTER_NAME
-from .containers import ContainerFormatError, open_container
+from .containers import ContainerFormatError, Container, open_container, containers
 from .font import Font
 from .pack import Pack
 from .streams import MagicRegistry, FileFormatError, open_stream
@@ -34,38 +36,56 @@ def open_location(file, mode, where=None, overwrite=False):
     if not file and not where:
         raise ValueError(f'No location provided.')
     # interpret incomplete arguments
-    # no choice - can't open a stream on a directory
-    if isinstance(file, (str, Path)) and Path(file).is_dir():
-        where = file
-        file = None
+    if isinstance(file, (str, Path)):
+        path = Path(file)
+        # no choice - can't open a stream on a directory
+        if path.is_dir():
+            where = file
+            file = None
     # only container location provided - traverse into it
     if where and not file:
-        with open_container(where, mode, overwrite=True) as container:
+        with _open_where(where, mode) as container:
             # empty file parameter means 'load/save all'
             yield None, container
         return
     if not where and isinstance(file, (str, Path)):
         # see if file is itself a container
         # don't open containers if we only have a stream - we don't want surprise directory creation
-        try:
-            with open_container(file, mode, overwrite=overwrite) as container:
-                yield None, container
-            return
-        except ContainerFormatError as e:
-            # file is not itself a container, use enclosing dir as container
-            where = Path(file).parent
-            file = Path(file).name
-    # we have a stream and maybe a container
-    with open_container(where, mode, overwrite=True) as container:
-        with open_stream(file, mode, where=container, overwrite=overwrite) as stream:
-            # see if file is itself a container
+        # on read, this is checked on the stream below so that we only open the file once
+        if mode == 'w':
             try:
-                with open_container(stream, mode, overwrite=overwrite) as container:
+                with open_container(file, mode, overwrite=overwrite) as container:
                     yield None, container
                 return
             except ContainerFormatError as e:
-                # infile is not a container, load/save single file
-                yield stream, container
+                pass
+        # file is not itself a container, use enclosing dir as container
+        where = path.parent
+        file = path.name
+    # we have a stream and maybe a container
+    with _open_where(where, mode) as container:
+        with open_stream(file, mode, where=container, overwrite=overwrite) as stream:
+            # see if file is itself a container
+            # check the magic or suffix first, so that we don't try opening every font file
+            container_type = containers.identify(stream, do_open=(mode == 'r'))
+            if container_type:
+                try:
+                    with open_container(
+                            stream, mode, overwrite=overwrite, container_type=container_type
+                        ) as container:
+                        yield None, container
+                    return
+                except ContainerFormatError as e:
+                    pass
+            # infile is not a container, load/save single file
+            yield stream, container
+
+def _open_where(where, mode):
+    """Open container location, or use it as is if it is already a container."""
+    if isinstance(where, Container):
+        # opened by the caller, who will also close it
+        return nullcontext(where)
+    return open_container(where, mode, overwrite=True)
 
 
 ##############################################################################
@@ -85,41 +105,47 @@ def _load_from_file(instream, where, format, **kwargs):
     # identify file type
     loader = loaders.get_for(instream, format=format, do_open=True)
     if not loader:
-        raise FileFormatError('Cannot load from format `{}`.'.format(format)) from None
+        raise FileFormatError('Cannot load from format `%s`.', format) from None
     logging.info('Loading `%s` on `%s` as %s', instream.name, where.name, loader.name)
     fonts = loader(instream, where, **kwargs)
-    # convert font or pack to pack
     if not fonts:
         raise FileFormatError('No fonts found in file.')
-    pack = Pack(fonts)
-    # set conversion properties
-    filename = Path(instream.name).name
+    # loaders return a font or a sequence of fonts
+    if isinstance(fonts, Font):
+        fonts = fonts,
+    # set conversion properties, building the pack only once
+    # share the file name between fonts loaded from files with the same name
+    filename = sys.intern(Path(instream.name).name)
     return Pack(
         _font.set_properties(
             converter=CONVERTER_NAME,
             source_format=_font.source_format or loader.name,
             source_name=_font.source_name or filename
         )
-        for _font in pack
+        for _font in fonts
     )
 
 def _load_all(container, format, **kwargs):
     """Open container and load all fonts found in it into one pack."""
     logging.info('Reading all from `%s`.', container.name)
-    packs = Pack()
-    # try opening a container on input file for read, will raise error if not container format
-    for name in container:
-        logging.debug('Trying `%s` on `%s`.', name, container.name)
-        with open_stream(name, 'r', where=container) as stream:
-            try:
-                pack = load(stream, where=container, format=format, **kwargs)
-            except Exception as exc:
-                # if one font fails for any reason, try the next
-                # loaders raise ValueError if unable to parse
-                logging.debug('Could not load `%s`: %s', name, exc)
-            else:
-                packs += Pack(pack)
-    return packs
+    packs = map(partial(_load_member, container, format, **kwargs), container)
+    # collect fonts in a list, concatenating packs is quadratic in the number of files
+    return Pack([_font for _pack in packs for _font in _pack])
+
+def _load_member(container, format, name, **kwargs):
+    """Load fonts from a file in a container, or none if it can't be loaded."""
+    logging.debug('Trying `%s` on `%s`.', name, container.name)
+    with open_stream(name, 'r', where=container) as stream:
+        try:
+            # only nested containers need to go through open_location
+            if containers.identify(stream, do_open=True):
+                return load(stream, where=container, format=format, **kwargs)
+            return _load_from_file(stream, container, format, **kwargs)
+        except Exception as exc:
+            # if one font fails for any reason, try the next
+            # loaders raise ValueError if unable to parse
+            logging.debug('Could not load `%s`: %s', name, exc)
+            return ()
 
 
 ##############################################################################
@@ -148,14 +174,17 @@ def save(
 def _save_all(pack, where, format, **kwargs):
     """Save fonts to a container."""
     logging.info('Writing all to `%s`.', where.name)
+    # format and saver are the same for all files
+    format = format or DEFAULT_FORMAT
+    saver = savers.get_for(format=format)
     for font in pack:
         # generate unique filename
         name = font.name.replace(' ', '_')
-        format = format or DEFAULT_FORMAT
         filename = where.unused_name(name, format)
         try:
             with open_stream(filename, 'w', where=where) as stream:
-                _save_to_file(Pack(font), stream, where, format, **kwargs)
+                # savers take any sequence of fonts, no need for a pack
+                _save_with(saver, (font,), stream, where, format, **kwargs)
         except BrokenPipeError:
             pass
         except Exception as e:
@@ -165,8 +194,12 @@ def _save_all(pack, where, format, **kwargs):
 def _save_to_file(pack, outfile, where, format, **kwargs):
     """Save fonts to a single file."""
     saver = savers.get_for(outfile, format=format, do_open=False)
+    _save_with(saver, pack, outfile, where, format, **kwargs)
+
+def _save_with(saver, pack, outfile, where, format, **kwargs):
+    """Save fonts to a single file using the given saver."""
     if not saver:
-        raise FileFormatError('Cannot save to format `{}`.'.format(format))
+        raise FileFormatError('Cannot save to format `%s`.', format)
     logging.info('Saving `%s` on `%s` as %s.', outfile.name, where.name, saver.name)
     saver(pack, outfile, where, **kwargs)
 
@@ -177,17 +210,20 @@ def _save_to_file(pack, outfile, where, format, **kwargs):
 class ConverterRegistry(MagicRegistry):
     """Loader/Saver registry."""
 
+    def __init__(self):
+        """Set up registry."""
+        super().__init__()
+        # converter to use if format is not given and can't be identified
+        self._default = None
+
     def get_for(self, file=None, format='', do_open=False):
         """
         Get loader/saver function for this format.
         infile must be a Stream or empty
         """
-        converter = None
-        if not format:
-            converter = self.identify(file, do_open=do_open)
-        if not converter:
-            converter = self[format or DEFAULT_FORMAT]
-        return converter
+        if format:
+            return self[format]
+        return self.identify(file, do_open=do_open) or self._default
 
     def get_args(self, file=None, format='', do_open=False):
         """
@@ -229,6 +265,7 @@ class ConverterRegistry(MagicRegistry):
                 _func.magic = magic
             # register magic sequences
             register_magic(*_func.formats, magic=_func.magic)(_func)
+            self._default = self[DEFAULT_FORMAT]
             return _func
 
         return _decorator
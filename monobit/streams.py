@@ -6,14 +6,30 @@ licence: https://opensource.org/licenses/MIT
 """
 
 import io
+import os
 import sys
+import stat
+import errno
+import mmap
 import logging
 from pathlib import Path
 
 
+# buffer size for streams we open ourselves
+# font files are read and written sequentially, so a large buffer saves on system calls
+BUFFER_SIZE = 0x40000
+
+
 class FileFormatError(Exception):
     """Incorrect file format."""
 
+    def __str__(self):
+        """Fill in message template, which can be given with %-style arguments."""
+        # formatting is deferred as many of these are caught and discarded
+        if len(self.args) > 1:
+            return self.args[0] % self.args[1:]
+        return super().__str__()
+
 
 def open_stream(file, mode, *, where=None, overwrite=False):
     """Ensure file is a stream of the right type, open or wrap if necessary."""
@@ -123,7 +139,10 @@ class Stream(StreamWrapper):
             if not overwrite and mode == 'w' and path.exists():
                 raise FileExistsError(f'Will not overwrite existing file `{file}`.')
             logging.debug("Opening file `%s` for mode '%s'.", file, mode)
-            file = io.open(path, mode + 'b')
+            if mode == 'r':
+                file = open_mapped(path)
+            else:
+                file = io.open(path, mode + 'b', buffering=BUFFER_SIZE)
         else:
             # open on container
             if not overwrite and mode == 'w' and file in where:
@@ -183,6 +202,81 @@ class Stream(StreamWrapper):
                 pass
 
 
+def open_mapped(path):
+    """Open a buffered binary reader on a memory-mapped file, or on the file itself if not mappable."""
+    # open only once, so that we don't lose what has been sent to a pipe
+    file = io.open(path, 'rb', buffering=0)
+    try:
+        status = os.fstat(file.fileno())
+        # only regular, non-empty files can be mapped
+        if stat.S_ISREG(status.st_mode) and status.st_size:
+            try:
+                raw = MappedFile(file)
+            except (ValueError, OSError):
+                # e.g. file system doesn't support mapping
+                pass
+            else:
+                # the map keeps its own handle on the file
+                file.close()
+                return io.BufferedReader(raw, buffer_size=BUFFER_SIZE)
+    except BaseException:
+        file.close()
+        raise
+    return io.BufferedReader(file, buffer_size=BUFFER_SIZE)
+
+
+class MappedFile(io.RawIOBase):
+    """Read-only raw stream on a memory-mapped file."""
+
+    def __init__(self, file):
+        """Map an open file into memory."""
+        super().__init__()
+        self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.name = file.name
+        # files are read front to back, let the kernel read ahead aggressively
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            self._map.madvise(mmap.MADV_SEQUENTIAL)
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        """Copy from the map into a buffer, without a system call."""
+        data = self._map[self._pos : self._pos + len(buffer)]
+        buffer[:len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
+    def readall(self):
+        """Read the rest of the file in one slice."""
+        data = self._map[self._pos:]
+        self._pos += len(data)
+        return data
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._map)
+        if offset < 0:
+            # same error as for regular files
+            raise OSError(errno.EINVAL, f'Invalid seek position {offset}.')
+        self._pos = offset
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+    def close(self):
+        if not self.closed:
+            self._map.close()
+        super().close()
+
+
 def is_binary(stream):
     """Check if stream is binary."""
     if stream.readable():
@@ -221,13 +315,27 @@ def get_suffix(file):
         suffix = Path(get_name(file)).suffix
     return normalise_suffix(suffix)
 
-def has_magic(instream, magic):
-    """Check if a binary stream matches the given signature."""
+def read_header(path, length):
+    """Read the first bytes of a file on the filesystem."""
+    with io.open(path, 'rb', buffering=0) as file:
+        return file.read(length)
+
+def get_header(instream, length):
+    """Get the first bytes of a binary stream without consuming them; empty if not readable."""
     try:
-        return instream.peek(len(magic)).startswith(magic)
+        try:
+            return instream.peek(length)[:length]
+        except AttributeError:
+            # unbuffered stream, e.g. BytesIO: read once and go back if we can
+            if not instream.seekable():
+                return b''
+            pos = instream.tell()
+            header = instream.read(length)
+            instream.seek(pos)
+            return header
     except EnvironmentError:
         # e.g. write-only stream
-        return False
+        return b''
 
 
 class MagicRegistry:
@@ -237,6 +345,10 @@ class MagicRegistry:
         """Set up registry."""
         self._magic = {}
         self._suffixes = {}
+        # magic sequences by length, longest first, to match against file header
+        self._magic_index = {}
+        # length of file header that can contain magic
+        self._header_length = 0
 
     def register(self, *suffixes, magic=()):
         """Decorator to register class that handles file type."""
@@ -246,6 +358,11 @@ class MagicRegistry:
                 self._suffixes[suffix] = klass
             for sequence in magic:
                 self._magic[sequence] = klass
+                self._header_length = max(self._header_length, len(sequence))
+            self._magic_index = {
+                _length: {_m: _k for _m, _k in self._magic.items() if len(_m) == _length}
+                for _length in sorted(set(map(len, self._magic)), reverse=True)
+            }
             # use first suffix given as standard
             if suffixes:
                 klass.format = normalise_suffix(suffixes[0])
@@ -264,15 +381,20 @@ class MagicRegistry:
         """Identify a type from magic sequence on input file."""
         if not file:
             return None
-        # can't read magic on write-only file
-        if do_open:
-            if isinstance(file, (str, Path)):
-                # only use context manager if string provided
-                # if we got an open stream we should not close it
-                with open_stream(file, 'r') as stream:
-                    return self.identify(stream, do_open=do_open)
-            for magic, klass in self._magic.items():
-                if has_magic(file, magic):
-                    return klass
         suffix = get_suffix(file)
+        # can't read magic on write-only file
+        if not do_open:
+            return self[suffix]
+        if isinstance(file, (str, Path)):
+            # we only need the first few bytes, don't set up a stream
+            header = read_header(file, self._header_length)
+        else:
+            # if we got an open stream we should not close it
+            header = get_header(file, self._header_length)
+        # look up the start of the header for each magic length
+        # so that the longest, most specific, sequence wins
+        for length, magics in self._magic_index.items():
+            klass = magics.get(header[:length], None)
+            if klass:
+                return klass
         return self[suffix]
@@ -5,6 +5,7 @@ monobit.struct - property structures
 licence: https://opensource.org/licenses/MIT
 """
 
+import logging
 from types import SimpleNamespace
 from functools import partial
 import ctypes
@@ -50,6 +51,20 @@ class Props(SimpleNamespace):
         ))
 
 
+def log_props(name, props):
+    """Log a Props or a dict of properties, if INFO messages are shown."""
+    # don't format the properties if they will be discarded
+    if not logging.getLogger().isEnabledFor(logging.INFO):
+        return
+    logging.info('%s properties:', name)
+    if isinstance(props, dict):
+        for key, value in props.items():
+            logging.info('    %s: %s', key, value)
+    else:
+        for line in str(props).splitlines():
+            logging.info('    %s', line)
+
+
 ##############################################################################
 # binary structs
 
@@ -7,6 +7,7 @@ licence: https://opensource.org/licenses/MIT
 
 import unicodedata
 import pkgutil
+from functools import lru_cache
 from pathlib import Path
 
 from .encoding import unicode_name, is_printable, NotFoundError
@@ -53,11 +54,18 @@ class UnicodeTagger(Tagger):
 
     def get_tag(self, glyph):
         """Add unicode glyph names as comments, if no comment already exists."""
-        name = unicode_name(glyph.char)
-        if self.include_char and is_printable(glyph.char):
-            return '[{}] {}'.format(glyph.char, name)
-        else:
-            return '{}'.format(name)
+        return _get_unicode_tag(glyph.char, self.include_char)
+
+
+# the tag only depends on the char, remember it for repeated lookups
+@lru_cache(maxsize=4096)
+def _get_unicode_tag(char, include_char):
+    """Get unicode tag for char."""
+    name = unicode_name(char)
+    if include_char and is_printable(char):
+        return '[{}] {}'.format(char, name)
+    else:
+        return '{}'.format(name)
 
 
 class MappingTagger(Tagger):
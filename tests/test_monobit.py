@@ -12,6 +12,7 @@ usage::
 import os
 import io
 import tempfile
+import zipfile
 import unittest
 import logging
 from pathlib import Path
@@ -312,6 +313,15 @@ class TestContainers(BaseTester):
         """Test importing/exporting tar files."""
         self._test_container('tar')
 
+    def test_unique_names(self):
+        """Test fonts with the same name get separate files in an archive."""
+        container_file = self.temp_path / '4x6.zip'
+        monobit.save((self.fixed4x6, self.fixed4x6), container_file)
+        with zipfile.ZipFile(container_file) as zip:
+            names = zip.namelist()
+        self.assertEqual(len(names), 2)
+        self.assertEqual(len(set(names)), 2)
+
     def test_tgz(self):
         """Test importing/exporting compressed tar files."""
         self._test_container('tar.gz')
@@ -347,6 +357,14 @@ class TestStreams(BaseTester):
             font, *_ = monobit.load(stream)
         self.assertEqual(len(font.glyphs), 919)
 
+    def test_unbuffered_stream(self):
+        """Test importing psf files from seekable stream without peek()."""
+        with open(self.font_path / '4x6.psf', 'rb') as f:
+            fontbuffer = f.read()
+        with io.BytesIO(fontbuffer) as stream:
+            font, *_ = monobit.load(stream)
+        self.assertEqual(len(font.glyphs), 919)
+
     def test_text_stream(self):
         """Test importing bdf files from text stream."""
         # we still need an underlying binary buffer, which StringIO doesn't have
@@ -368,5 +386,56 @@ class TestStreams(BaseTester):
             self.assertTrue(stream.getvalue().startswith(b'---'))
 
 
+class TestGlyphOperations(BaseTester):
+    """Test glyph transformations."""
+
+    glyph = monobit.Glyph(((1, 0, 0), (1, 1, 0)))
+
+    def test_invert(self):
+        """Test inverting a glyph."""
+        self.assertEqual(
+            self.glyph.invert().as_matrix(),
+            ((0, 1, 1), (0, 0, 1))
+        )
+
+    def test_rotate(self):
+        """Test rotating a glyph."""
+        self.assertEqual(
+            self.glyph.rotate(turns=1).as_matrix(),
+            ((1, 1), (1, 0), (0, 0))
+        )
+        self.assertEqual(
+            self.glyph.rotate(turns=2).as_matrix(),
+            ((0, 1, 1), (0, 0, 1))
+        )
+        self.assertEqual(
+            self.glyph.rotate(turns=3).as_matrix(),
+            ((0, 0), (0, 1), (1, 1))
+        )
+
+    def test_stretch(self):
+        """Test stretching a glyph."""
+        self.assertEqual(
+            self.glyph.stretch(factor_x=2, factor_y=2).as_matrix(),
+            (
+                (1, 1, 0, 0, 0, 0), (1, 1, 0, 0, 0, 0),
+                (1, 1, 1, 1, 0, 0), (1, 1, 1, 1, 0, 0),
+            )
+        )
+
+    def test_shrink(self):
+        """Test shrinking a stretched glyph."""
+        stretched = self.glyph.stretch(factor_x=2, factor_y=3)
+        self.assertEqual(
+            stretched.shrink(factor_x=2, factor_y=3).as_matrix(),
+            self.glyph.as_matrix()
+        )
+
+    def test_shrink_lossy(self):
+        """Test refusing to shrink glyph with loss."""
+        with self.assertRaises(ValueError):
+            self.glyph.shrink(factor_y=2)
+
+
 if __name__ == '__main__':
     unittest.main()